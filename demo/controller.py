@@ -8,18 +8,37 @@ Dependencies with installation instructions:
   - macOS: brew install csound
   - Windows: choco install csound, or download and install binary from https://csound.com/download.html
 """
+import logging
 import os.path as osp
 import shutil
 import sys
-import time
 # 3rd party
 import kkpyutil as util
-import pythonosc.udp_client as osc_client
 # project
 _script_dir = osp.abspath(osp.dirname(__file__))
-sys.path.insert(0, repo_root := osp.abspath(f'{_script_dir}/..'))
+# keep the checkout ahead of any installed copy, but do not shift sys.path when already there
+if (repo_root := osp.dirname(_script_dir)) not in sys.path:
+    sys.path.insert(0, repo_root)
 import kkpyui as ui
 
+_ICON_FILE = osp.join(_script_dir, 'icon.png')
+_CSD_FILE = osp.join(_script_dir, 'tonegen.csd')
+_OSC_WAVES = ('Sine', 'Square', 'Sawtooth')
+_CSD_FILTERS = (('Csound Script', '*.csd'), ('All Files', '*.*'))
+_sender = None
+
+
+def _get_sender():
+    """
+    - one socket per process, so reloading the controller does not pile up descriptors
+    """
+    global _sender
+    if _sender is None:
+        # deferred so that importing this module does not pull in pythonosc
+        import pythonosc.udp_client as osc_client
+        _sender = osc_client.SimpleUDPClient('127.0.0.1', 10000)
+    return _sender
+
 
 class Controller(ui.FormController):
     """
@@ -34,10 +53,16 @@ class Controller(ui.FormController):
       - kk OSClisten gilisten, "/stop", "i", gkstop
       - kk OSClisten gilisten, "/quit", "i", gkquit
     """
+    waveIndex = {wave: i for i, wave in enumerate(_OSC_WAVES)}
 
     def __init__(self, fm=None, model=None):
         super().__init__(fm, model)
-        self.sender = osc_client.SimpleUDPClient('127.0.0.1', 10000)
+        self.sender = _get_sender()
+        # tracers fire per spinner tick or slider pixel, so keep their path short
+        self.send = self.sender.send_message
+        # coalesce bursts of tracer writes: only the last value per address is sent
+        self.pendingMsgs = {}
+        self.isFlushScheduled = False
         self.playing = False
         self.curEngine = None
 
@@ -51,19 +76,23 @@ class Controller(ui.FormController):
         if self.curEngine != self.model['engine']:
             self.on_shutdown()
             self.on_startup()
-        options = ['Sine', 'Square', 'Sawtooth']
-        self.sender.send_message('/oscillator', options.index(self.model['oscillator']))
-        self.sender.send_message('/frequency', self.model['frequency'])
-        self.sender.send_message('/gain', self.model['gain'])
-        self.sender.send_message('/play', 1)
+        self.send_bundle(
+            ('/oscillator', self.waveIndex[self.model['oscillator']]),
+            ('/frequency', self.model['frequency']),
+            ('/gain', self.model['gain']),
+            ('/play', 1),
+        )
         self.start_progress()
         self.playing = True
         return True
 
     def on_cancel(self, event=None):
-        self.sender.send_message('/play', 0)
+        """
+        - csound fades out on its own, so do not block the ui thread waiting for it
+        - clear the flag right away: run_task() may restart playback immediately after cancelling
+        """
+        self.send('/play', 0)
         self.stop_progress()
-        time.sleep(0.1)
         self.playing = False
 
     def on_startup(self):
@@ -71,9 +100,17 @@ class Controller(ui.FormController):
         cmd = [shutil.which('csound'), self.model['engine'], '-odac']
         util.run_daemon(cmd)
         self.curEngine = self.model['engine']
+        # warm up address resolution before the first real message; csound ignores unknown addresses
+        self.send('/ping', 0)
         # time.sleep(0.8)
 
     def on_shutdown(self, event=None) -> bool:
+        """
+        - kill synchronously:
+          - quitting must not exit before csound is gone, or the stale engine keeps the OSC port
+          - swapping engines happens in run_task(), which already runs on the task worker, off the ui thread
+          - the new engine must not start before the old one is killed by name, or it would be killed too
+        """
         if not super().on_shutdown():
             return False
         if ui.Globals.root.isActive:
@@ -83,35 +120,69 @@ class Controller(ui.FormController):
 
     def on_freq_changed(self, name, var, index, mode):
         freq = ui.safe_get_number(var)
-        print(f'{name=}={freq}, {index=}, {mode=}')
-        self.sender.send_message('/frequency', freq)
+        if util.glogger.isEnabledFor(logging.DEBUG):
+            util.glogger.debug('%s=%s, index=%s, mode=%s', name, freq, index, mode)
+        self.pendingMsgs['/frequency'] = freq
+        self._schedule_flush()
 
     def on_gain_changed(self, name, var, index, mode):
         gain = ui.safe_get_number(var)
-        print(f'{name=}={gain}, {index=}, {mode=}')
-        self.sender.send_message('/gain', gain)
+        if util.glogger.isEnabledFor(logging.DEBUG):
+            util.glogger.debug('%s=%s, index=%s, mode=%s', name, gain, index, mode)
+        self.pendingMsgs['/gain'] = gain
+        self._schedule_flush()
 
     def on_oscillator_changed(self, name, var, index, mode):
-        print(f'{name=}={var.get()}, {index=}, {mode=}')
-        self.sender.send_message('/play', 0)
-        time.sleep(0.1)
-        self.sender.send_message('/oscillator', var.get())
-        self.sender.send_message('/play', 1)
+        wave = var.get()
+        if util.glogger.isEnabledFor(logging.DEBUG):
+            util.glogger.debug('%s=%s, index=%s, mode=%s', name, wave, index, mode)
+        # csound's OSClisten consumes one queued message per address per k-cycle,
+        # so /play still sees 0 then 1 and retriggers with the new waveform
+        self.send_bundle(('/play', 0), ('/oscillator', wave), ('/play', 1))
+
+    def send_bundle(self, *messages):
+        """
+        - messages: (address, value) pairs, dispatched in order by the receiver
+        - one datagram instead of one per message
+        """
+        from pythonosc import osc_bundle_builder, osc_message_builder
+        bundle = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+        for addr, value in messages:
+            msg = osc_message_builder.OscMessageBuilder(address=addr)
+            msg.add_arg(value)
+            bundle.add_content(msg.build())
+        self.sender.send(bundle.build())
+
+    def _schedule_flush(self, wait_ms=10):
+        """
+        - a slider drag writes tens of values per second
+        - a short window is imperceptible but collapses them into one packet per parameter
+        """
+        if self.isFlushScheduled:
+            return
+        self.isFlushScheduled = True
+        ui.Globals.root.after(wait_ms, self._flush)
+
+    def _flush(self):
+        for addr, value in self.pendingMsgs.items():
+            self.send(addr, value)
+        self.pendingMsgs.clear()
+        self.isFlushScheduled = False
 
 
 def main():
-    ui.Globals.root = ui.Root('Controller Demo: Oscillator', (800, 600), osp.join(osp.dirname(__file__), 'icon.png'))
+    ui.Globals.root = ui.Root('Controller Demo: Oscillator', (800, 600), _ICON_FILE)
     ui.init_style()
     form = ui.Form(ui.Globals.root, ['general', 'output'])
     ctrlr = Controller(form)
     ui.Globals.root.set_controller(ctrlr)
     ui.Globals.root.bind_events()
     menu = ui.FormMenu(ui.Globals.root, ctrlr)
-    pg1 = form.pages['general']
-    pg2 = form.pages['output']
+    pg1 = form.get_page('general')
+    pg2 = form.get_page('output')
     # Adding widgets to pages
-    scpt_entry = ui.FileEntry(pg1, 'engine', 'Csound Script', osp.join(osp.dirname(__file__), 'tonegen.csd'), 'Path to Csound script', True, [('Csound Script', '*.csd'), ('All Files', '*.*')])
-    oscillator_entry = ui.SingleOptionEntry(pg1, 'oscillator', "Oscillator", ['Sine', 'Square', 'Sawtooth', ], 'Square', 'Oscillator waveform types')
+    scpt_entry = ui.FileEntry(pg1, 'engine', 'Csound Script', _CSD_FILE, 'Path to Csound script', True, _CSD_FILTERS)
+    oscillator_entry = ui.SingleOptionEntry(pg1, 'oscillator', "Oscillator", _OSC_WAVES, 'Square', 'Oscillator waveform types')
     freq_entry = ui.IntEntry(pg1, 'frequency', "Frequency (Hz)", 440, "Frequency of the output signal in Hertz", True, (20, 20000))
     gain_entry = ui.FloatEntry(pg1, 'gain', "Gain (dB)", -16.0, "Gain of the output signal in dB", True, (-48.0, 0.0), 1.0, 2)
     oscillator_entry.set_tracer(ctrlr.on_oscillator_changed)
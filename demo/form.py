@@ -16,12 +16,28 @@ import time
 
 # project
 _script_dir = osp.abspath(osp.dirname(__file__))
-sys.path.insert(0, repo_root := osp.abspath(f'{_script_dir}/..'))
+# keep the checkout ahead of any installed copy, but do not shift sys.path when already there
+if (repo_root := osp.dirname(_script_dir)) not in sys.path:
+    sys.path.insert(0, repo_root)
 import kkpyui as ui
 import kkpyutil as util
+# optional: C-accelerated json for dumping the result
+try:
+    import orjson
+
+    def _dump_json(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dump_json(obj):
+        return json.dumps(obj, indent=2)
+
+_BIO_FILE = osp.join(_script_dir, 'assets', 'robin_bio.txt')
+_GENDERS = ('Male', 'Female', '[Secret]')
+_OCCUPATIONS = ('Lead', 'Warrior', 'Wizard', 'Detective', 'Hacker', 'Clerk')
 
 
 class Controller(ui.FormController):
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -43,18 +59,24 @@ class Controller(ui.FormController):
         - run in background thread to avoid blocking UI
         """
         self.start_progress()
+        # bind loop-invariant lookups once
+        set_progress, wait_for_stop = self.set_progress, self.taskStopEvent.wait
+        last_p, last_post = -5, 0.
         for p in range(101):
-            # Simulate a task
-            time.sleep(0.01)
-            self.set_progress('/processing', p, 'Processing ...')
-            if self.is_scheduled_to_stop():
+            # Simulate a task: waiting on the stop event both sleeps and reacts to cancelling instantly
+            if wait_for_stop(0.01):
                 self.stop_progress()
                 return
+            # every 5% or 50ms, whichever comes first, is as smooth as the bar can redraw
+            now = time.monotonic()
+            if p - last_p >= 5 or now - last_post >= 0.05 or p == 100:
+                set_progress('/processing', p, 'Processing ...')
+                last_p, last_post = p, now
         self.stop_progress()
         out = vars(self.get_latest_model())
         self.model['export'] = osp.join(util.get_platform_tmp_dir(), 'form.out.json')
         util.save_json(self.model['export'], out)
-        dmp = json.dumps(self.model, indent=2)
+        dmp = _dump_json(self.model)
         self.info(f'{dmp}', confirm=True)
         self.update_view()
 
@@ -69,18 +91,19 @@ def main():
     ui.Globals.root.bind_events()
     menu = ui.FormMenu(ui.Globals.root, ctrlr)
     # Adding widgets to pages
-    pg1 = form.pages['profile']
-    pg2 = form.pages['plot']
-    pg3 = form.pages['output']
+    pg1 = form.get_page('profile')
+    pg2 = form.get_page('plot')
+    pg3 = form.get_page('output')
     name_wgt = ui.TextEntry(pg1, 'name', "Name", "Robin Sena", "text widget.")
     age_wgt = ui.IntEntry(pg1, 'age', "Age", 15, "integer widget", True, (0, float('inf')))
     height_wgt = ui.FloatEntry(pg1, 'height', "Height (m)", 1.68, "float widget", True, (0.0, 2.0), 0.01, 2)
     weight_wgt = ui.FloatEntry(pg1, 'weight', "Weight (kg)", 51, "float widget", True, (50.2, 70.3), 0.1, 1)
-    gender_wgt = ui.SingleOptionEntry(pg1, 'gender', "Gender", ["Male", "Female", "[Secret]"], "Female", "option widget")
+    gender_wgt = ui.SingleOptionEntry(pg1, 'gender', "Gender", _GENDERS, "Female", "option widget")
     protagonist_wgt = ui.BoolEntry(pg1, 'is_protagonist', "Protagonist", True, "checkbox widget")
-    bio_widget = ui.TextEntry(pg1, 'bio', "Bio", """Robin Sena (瀬名 ロビン, Sena Robin) is a soft-spoken 15-year-old Hunter and craft-user with pyrokinetic abilities. She was raised in a convent in Italy-(where she was taught how to use and control her
-    craft in hunting down Witches) before she was sent to the STN-J to gather information for the Solomon administration; even though she was born in Japan, she had moved to Tuscany when she was still very young. Her witch powers allow her to channel her energy into shields capable of blocking solid matter and crafts, magical powers. -- Wikipedia""", 'text widget.')
-    occupation_wgt = ui.MultiOptionEntry(pg2, 'occupation', 'Occupation', ['Lead', 'Warrior', 'Wizard', 'Detective', 'Hacker', 'Clerk'], ['Wizard', 'Detective'], "option widget")
+    with open(_BIO_FILE, encoding='utf-8') as f:
+        bio = f.read().strip()
+    bio_widget = ui.TextEntry(pg1, 'bio', "Bio", bio, 'text widget.')
+    occupation_wgt = ui.MultiOptionEntry(pg2, 'occupation', 'Occupation', _OCCUPATIONS, ['Wizard', 'Detective'], "option widget")
     episode_wgt = ui.ListEntry(pg2, 'episodes', 'Appeared in Episodes', ['ep01', 'ep02', 'ep03', 'ep04', 'ep05', 'ep06', 'ep07', 'ep08', 'ep09', 'ep10', 'ep11', 'ep12', 'ep13', 'ep14', 'ep15', 'ep16', 'ep17', 'ep18', 'ep19', 'ep20', 'ep21', 'ep22',
                                                                          'ep23', 'ep24', 'ep25', 'ep26'], 'List of episodes in which this character appears', True)
     export_wgt = ui.ReadOnlyPathEntry(pg3, 'export', 'Export to File', '', 'Path to exported file')
@@ -1,5 +1,6 @@
-import csv
-import json
+import collections
+import functools
+import itertools
 import os.path as osp
 import queue
 import threading
@@ -14,11 +15,37 @@ from tkinter.font import Font as tkFont
 import kkpyutil as util
 
 
+class SpscQueue:
+    """
+    - single-producer (task thread) / single-consumer (ui thread) channel
+    - deque.append() and deque.popleft() are atomic under the GIL, so no lock or condition is needed
+    - mirrors the queue.Queue subset used by progress reporting, so progress bars also accept a plain queue.Queue
+    """
+
+    def __init__(self):
+        self._deque = collections.deque()
+
+    def put(self, item):
+        self._deque.append(item)
+
+    def get_nowait(self):
+        try:
+            return self._deque.popleft()
+        except IndexError:
+            raise queue.Empty
+
+    def qsize(self):
+        return len(self._deque)
+
+
 class Globals:
     root = None
-    progressQueue = queue.Queue()
+    progressQueue = SpscQueue()
     taskStopEvent = threading.Event()
     style = None
+    lastBellTime = 0.0
+    # one popup shared by all entries, retargeted on each popup
+    entryMenu = None
 
 
 def init_style():
@@ -134,6 +161,39 @@ def init_style():
               arrowcolor=[("active", "#FFF")])  # Change arrow color on hover
 
 
+def ring_bell(min_interval=0.25):
+    """
+    - a burst of failures rings once: each bell is a blocking trip to the audio system on some platforms
+    """
+    if (now := time.monotonic()) - Globals.lastBellTime < min_interval:
+        return
+    Globals.lastBellTime = now
+    Globals.root.bell()
+
+
+def _forward_trace(handler, var, name, index, mode):
+    """
+    - adapt Tk's trace signature (name, index, mode) to entry tracers' (name, var, index, mode)
+    """
+    handler(name, var, index, mode)
+
+
+def _unbind(widget, sequence, funcid, tag=None):
+    """
+    - remove one handler added with bind(..., add='+') or bind_all(..., add='+') and keep the others
+    - Misc.unbind(sequence, funcid) before Python 3.13 drops every handler of the sequence
+    - tag: bind tag holding the handler, e.g., 'all'; defaults to the widget itself
+    """
+    tag = tag or str(widget)
+    try:
+        kept = '\n'.join(line for line in widget.tk.call('bind', tag, sequence).split('\n') if funcid not in line)
+        widget.tk.call('bind', tag, sequence, kept)
+        widget.deletecommand(funcid)
+    except tk.TclError:
+        # widget is gone already, and its bindings with it
+        pass
+
+
 def safe_get_number(tknumvar: tk.Variable):
     """
     - swallow crash and give caller clues to handle with
@@ -156,15 +216,9 @@ class Root(tk.Tk):
     def __init__(self, title, size=(800, 600), icon=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.title(title)
-        screen_size = (self.winfo_screenwidth(), self.winfo_screenheight())
-        self.geometry('{}x{}+{}+{}'.format(
-            size[0],
-            size[1],
-            int(screen_size[0] / 2 - size[0] / 2),
-            int(screen_size[1] / 2 - size[1] / 2))
-        )
-        # self.validateIntCmd = (self.register(_validate_int), '%P', '%S', '%W')
-        # self.validateFloatCmd = (self.register(_validate_float), '%P', '%S', '%W')
+        screen_w, screen_h = self.winfo_screenwidth(), self.winfo_screenheight()
+        w, h = size
+        self.geometry(f'{w}x{h}+{(screen_w - w) // 2}+{(screen_h - h) // 2}')
         if icon:
             self.iconphoto(True, tk.PhotoImage(file=icon))
         self.controller = None
@@ -190,12 +244,13 @@ class Root(tk.Tk):
         - refer to Inter-Client Communication Conventions Manual ICCCM for possible window events
         """
         self.bind("<Return>", self.controller.on_submit)
-        self.bind("<Escape>", lambda event: self.controller.on_cancel(event))
+        self.bind("<Escape>", self.controller.on_cancel)
         # Expose: called even when slider is dragged, so we don't use it
         # Map: triggered when windows are visible, called every frame
         # Destroy: triggered when windows are closed, called every frame
-        self.bind('<Map>', lambda event: self.on_during_activate(event))
-        self.bind('<Destroy>', lambda event: self.on_during_deactivate(event))
+        # add: widgets, e.g., progressbars, also watch the root's mapping
+        self.bind('<Map>', self.on_during_activate, add='+')
+        self.bind('<Destroy>', self.on_during_deactivate, add='+')
         # startup event: init(), must be called by client
         # bind X button to quit the program
         self.protocol('WM_DELETE_WINDOW', self.controller.on_quit)
@@ -209,9 +264,12 @@ class Root(tk.Tk):
             if isinstance(event.widget, tk.Tk):
                 event.widget.attributes('-topmost', False)
 
-        self.attributes('-topmost', True)
-        self.focus_force()
-        self.bind('<FocusIn>', _unpin_root)
+        # already pinned, e.g., by a host app: nothing to pin, and nothing of ours to unpin later
+        if not self.attributes('-topmost'):
+            self.attributes('-topmost', True)
+            self.bind('<FocusIn>', _unpin_root)
+        if self.focus_displayof() is not self:
+            self.focus_force()
 
     def mainloop(self, n: int = 0):
         """
@@ -248,8 +306,9 @@ class Prompt:
     - otherwise the app will freeze upon confirmation
     """
 
-    def __init__(self, master=Globals.root, logger=None):
-        self.master = master
+    def __init__(self, master=None, logger=None):
+        # resolve root at call time: a default arg would freeze it at import, when it is still None
+        self.master = master or Globals.root
         self.logger = logger or util.glogger
 
     def info(self, msg, confirm=True):
@@ -296,14 +355,27 @@ Will crash"""
 
 
 class Page(ttk.LabelFrame):
-    def __init__(self, master, title, **kwargs):
+    def __init__(self, master, title, form=None, **kwargs):
         super().__init__(master, text=title, **kwargs)
         self.grid_columnconfigure(0, weight=1)
+        # python-side registry in creation order, spares form-wide ops a Tcl winfo-children query
+        self.entries = []
+        # owning form, whose key index is kept current as entries are added
+        self.form = form
+
+    def register(self, entry):
+        """
+        - called once by each entry on construction
+        """
+        self.entries.append(entry)
+        if self.form:
+            self.form.entryByKey[entry.key] = entry
 
     @staticmethod
     def add(entries):
         """
         - vertical layout
+        - layout only, so that re-adding an entry does not register it twice
         """
         for entry in entries:
             entry.layout()
@@ -326,18 +398,27 @@ class ScrollFrame(ttk.Frame):
             # Update the scrollbars to match the size of the inner frame.
             width, height = (self.frame.winfo_reqwidth(),
                              self.frame.winfo_reqheight())
-            self.canvas.configure(scrollregion=(0, 0, width, height), bg='#303841', highlightthickness=0)
-            if self.frame.winfo_reqwidth() != self.canvas.winfo_width():
+            # child-configure events cascade during construction and resizing, most with no size change
+            if (width, height) == self.lastReqSize:
+                return
+            self.lastReqSize = (width, height)
+            self.canvas.configure(scrollregion=(0, 0, width, height))
+            if width != self.canvas.winfo_width():
                 # update the canvas's width to fit the inner frame
-                self.canvas.config(width=self.frame.winfo_reqwidth())
+                self.canvas.config(width=width)
 
         def _configure_canvas(event):
+            if event.width == self.lastCanvasWidth:
+                return
+            self.lastCanvasWidth = event.width
             # update the inner frame's width to fill the canvas
-            if self.frame.winfo_reqwidth() != self.canvas.winfo_width():
-                self.canvas.itemconfigure(frame_id, width=self.canvas.winfo_width())
+            if self.frame.winfo_reqwidth() != event.width:
+                self.canvas.itemconfigure(frame_id, width=event.width)
 
         super().__init__(master, *args, **kwargs)
-        self.canvas = tk.Canvas(self, bd=0, highlightthickness=0)
+        self.lastReqSize = (-1, -1)
+        self.lastCanvasWidth = -1
+        self.canvas = tk.Canvas(self, bd=0, highlightthickness=0, bg='#303841')
         scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview, style='Vertical.TScrollbar')
         # scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
         self.canvas.configure(yscrollcommand=scrollbar.set)
@@ -352,20 +433,59 @@ class ScrollFrame(ttk.Frame):
         scrollbar.pack(side="right", fill="y")
         self.canvas.pack(side="left", fill="both", expand=True)
 
-        self.frame.bind("<Enter>", self._bound_to_mousewheel)
-        self.frame.bind("<Leave>", self._unbound_to_mousewheel)
+        # fast wheels and trackpads fire many events per frame, so scroll once per idle tick
+        self.wheelUnits = 0
+        # raw delta below one unit; touchpads send many small deltas that would each truncate to zero
+        self.wheelDelta = 0
+        self.isWheelPending = False
+        # macOS reports raw wheel steps, others report multiples of 120
+        self.wheelDivisor = 1 if util.PLATFORM == 'Darwin' else 120
+        # bind once for the app and hit-test, instead of re-binding globally on every <Enter>/<Leave>
+        # - add: other scroll frames share the same global binding
+        # - Button-4/5: X11 reports wheel as buttons
+        # - removed on <Destroy>, or dead frames would keep receiving every wheel event of the app
+        self.wheelBindings = [(seq, self.bind_all(seq, self._on_mouse_scroll, add='+')) for seq in ('<MouseWheel>', '<Button-4>', '<Button-5>')]
+        self.bind('<Destroy>', self._on_destroyed, add='+')
 
     def _on_canvas_configure(self, event):
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
+    def _on_destroyed(self, event):
+        # <Destroy> also arrives for each child
+        if event.widget is not self:
+            return
+        for seq, funcid in self.wheelBindings:
+            _unbind(self, seq, funcid, tag='all')
+        self.wheelBindings = []
+
     def _on_mouse_scroll(self, event):
-        self.canvas.yview_scroll(-1 * int(event.delta / 120), "units")
+        if not self._is_inside(event.widget):
+            return
+        if event.num in (4, 5):
+            self.wheelUnits += -1 if event.num == 4 else 1
+        else:
+            self.wheelDelta -= event.delta
+            # truncate toward zero and carry the remainder, so direction changes drop nothing either
+            units = int(self.wheelDelta / self.wheelDivisor)
+            self.wheelDelta -= units * self.wheelDivisor
+            self.wheelUnits += units
+        if self.isWheelPending:
+            return
+        self.isWheelPending = True
+        self.after_idle(self._flush_mouse_scroll)
 
-    def _bound_to_mousewheel(self, event):
-        self.canvas.bind_all("<MouseWheel>", self._on_mouse_scroll)
+    def _flush_mouse_scroll(self):
+        units, self.wheelUnits = self.wheelUnits, 0
+        self.isWheelPending = False
+        if units:
+            self.canvas.yview_scroll(units, "units")
 
-    def _unbound_to_mousewheel(self, event):
-        self.canvas.unbind_all("<MouseWheel>")
+    def _is_inside(self, widget):
+        """
+        - widget can be a path string for tk-internal popups
+        """
+        path, own_path = str(widget), str(self)
+        return path == own_path or path.startswith(own_path + '.')
 
 
 class Form(ttk.PanedWindow):
@@ -399,8 +519,20 @@ class Form(ttk.PanedWindow):
         # build form with navbar and page frame
         self.add(self.navPane, weight=0)
         self.add(self.entryPane, weight=1)
-        self.pages = {title.lower(): Page(self.entryPane.frame, title.title(),) for title in page_titles}
+        self.pageTitles = [title.lower() for title in page_titles]
+        self.pages = {title: Page(self.entryPane.frame, title.title(), form=self) for title in self.pageTitles}
+        # tree item id to page title, so navigation needs no Tcl lookup
+        self.titleByItem = {}
+        # all entries across pages by key, for preset loading; filled by pages as entries are added
+        self.entryByKey = {}
+        self.currentPage = None
         self.prompt = Prompt()
+        # filtering is debounced: typing a word triggers one rebuild instead of one per keystroke
+        self.pendingFilter = None
+        # entries currently filtered out, so that a new keyword only touches the changed ones
+        self.hiddenEntries = set()
+        # back-to-back repacks share one geometry flush
+        self.isLayoutDirty = False
         self.init()
         self.layout()
 
@@ -412,12 +544,19 @@ class Form(ttk.PanedWindow):
 
     def init(self):
         # Populate tree with page titles
-        for title, pg in self.pages.items():
-            self.tree.insert("", "end", text=title.title())
+        for title in self.pageTitles:
+            item = self.tree.insert("", "end", text=title.title())
+            self.titleByItem[item] = title
         # select first page
         self.tree.selection_set(self.tree.get_children()[0])
         self.update_entries(None)
 
+    def get_page(self, title):
+        """
+        - same as self.pages[title], but case-insensitive
+        """
+        return self.pages[title.lower()]
+
     def update_entries(self, event):
         """
         - the first call is triggered at binding time? where nothing is selected yet
@@ -425,55 +564,87 @@ class Form(ttk.PanedWindow):
         """
         selected_item = self.tree.focus()
         # selection will be blank on startup because no item is selected
-        selected_title = self.tree.item(selected_item, "text")
-        # Hide all pages
-        for pg in self.pages.values():
-            pg.pack_forget()
+        selected_title = self.titleByItem.get(selected_item)
+        new_page = self.get_page(selected_title or self.pageTitles[0])
+        # spurious selection events, e.g., programmatic selection_set(), must not repack anything
+        if new_page is self.currentPage:
+            return
+        # only the previous page is visible, so hide that one only
+        if self.currentPage is not None:
+            self.currentPage.pack_forget()
         # After hiding, update the right pane to ensure correct display
-        self.pages[selected_title.lower()].layout() if selected_title else list(self.pages.values())[0].layout()
-        self.entryPane.update()
+        new_page.layout()
+        self.currentPage = new_page
+        self._request_layout_flush()
+
+    def _request_layout_flush(self):
+        if self.isLayoutDirty:
+            return
+        self.isLayoutDirty = True
+        self.after_idle(self._flush_layout)
+
+    def _flush_layout(self):
+        self.isLayoutDirty = False
+        self.entryPane.update_idletasks()
 
     def _on_clear_search(self, event):
         if event.state != 4 or event.keysym != 'BackSpace':
             return
         self.searchEntry.delete(0, tk.END)
-        self.filter_entries(None)
+        self._cancel_pending_filter()
+        self._do_filter_entries()
 
-    def filter_entries(self, event):
+    def filter_entries(self, event, wait_ms=150):
         """
-        - must preserve entry order when keyword is cleared
-        TODO: optimize rebuilding speed
+        - rebuild once the user pauses typing
         """
+        self._cancel_pending_filter()
+        self.pendingFilter = self.after(wait_ms, self._do_filter_entries)
+
+    def _cancel_pending_filter(self):
+        if self.pendingFilter:
+            self.after_cancel(self.pendingFilter)
+            self.pendingFilter = None
+
+    def _do_filter_entries(self):
+        """
+        - must preserve entry order, including when keyword is cleared
+        - only entries whose visibility changes are re-packed
+        - packing appends to the end, so showing an entry re-packs the visible entries after it
+        """
+        self.pendingFilter = None
         keyword = self.searchEntry.get().strip().lower()
-        if not keyword:
-            for title, pg in self.pages.items():
-                for entry in pg.winfo_children():
-                    entry.pack_forget()
-            # After hiding, update the right pane to reset the initial display
-            for title, pg in self.pages.items():
-                for entry in pg.winfo_children():
-                    entry.layout()
-            self.entryPane.update()
-            return
         for title, pg in self.pages.items():
-            for entry in pg.winfo_children():
-                assert isinstance(entry, Entry)
-                if keyword not in entry.text.lower():
+            entries = pg.entries
+            matches = [keyword in entry.lowerText for entry in entries]
+            first_shown = None
+            for i, (entry, matched) in enumerate(zip(entries, matches)):
+                is_hidden = entry in self.hiddenEntries
+                if matched and is_hidden and first_shown is None:
+                    first_shown = i
+                elif not matched and not is_hidden:
                     entry.pack_forget()
-                    continue
+                    self.hiddenEntries.add(entry)
+            if first_shown is None:
+                continue
+            tail = [entry for entry, matched in zip(entries[first_shown:], matches[first_shown:]) if matched]
+            for entry in tail:
+                entry.pack_forget()
+            for entry in tail:
                 entry.layout()
-        self.entryPane.update()
+                self.hiddenEntries.discard(entry)
+        self._request_layout_flush()
 
     def validate_entries(self):
         for title, pg in self.pages.items():
-            for entry in pg.winfo_children():
+            for entry in pg.entries:
                 if not entry.validate_data():
                     return False
         return True
 
     def reset_entries(self):
         for title, pg in self.pages.items():
-            for entry in pg.winfo_children():
+            for entry in pg.entries:
                 entry.reset()
 
 
@@ -489,26 +660,27 @@ class Entry(ttk.Frame):
     def __init__(self, master: Page, key, text, widget_constructor, default, doc, presetable=True, **widget_kwargs):
         super().__init__(master,)
         assert isinstance(self.master, Page)
-        self.master.add([self])
         self.key = key
         self.text = text
+        # pre-lowered for keyword filtering
+        self.lowerText = text.lower()
         self.default = default
+        self.doc = doc
         self.isPresetable = presetable
+        # page indexes entries by key, so register only after identity is set
+        self.master.register(self)
+        self.master.add([self])
         # model-binding
         self.data = None
         # title
         self.label = ttk.Label(self, text=self.text, cursor='hand2', style='TLabel')
         self.label.pack(side='top', expand=True, padx=5, pady=2, anchor="w")
-        self.label.bind("<Double-Button-1>", lambda e: tkmsgbox.showinfo("Help", doc))
+        self.label.bind("<Double-Button-1>", self.show_help)
         # field
         self.field = widget_constructor(self, **widget_kwargs)
         self.columnconfigure(0, weight=1)
         self.field.pack(expand=True, padx=5, pady=2, anchor="w")
-        # context menu
-        self.contextMenu = tk.Menu(self, tearoff=0, bg='#333', fg='#DDD', bd=1, relief='flat', activebackground='#444', activeforeground='#FFF')
-        # use a context menu instead of direct clicking to avoid accidental reset
-        self.contextMenu.add_command(label="Help", command=lambda: tkmsgbox.showinfo("Help", doc))
-        self.contextMenu.add_command(label="Reset", command=self.reset)
+        # context menu: use a context menu instead of direct clicking to avoid accidental reset
         # maximize context-menu hitbox
         # - macos
         self.field.bind("<Button-2>", self.show_context_menu)
@@ -532,11 +704,40 @@ class Entry(ttk.Frame):
     def layout(self):
         self.pack(fill="both", expand=True, padx=5, pady=10, anchor="w")
 
+    def show_help(self, event=None):
+        tkmsgbox.showinfo("Help", self.doc)
+
     def show_context_menu(self, event):
+        """
+        - all entries share one menu; point its commands at this entry before popping up
+        """
+        menu = self._get_context_menu()
+        menu.entryconfigure(0, command=self.show_help)
+        menu.entryconfigure(1, command=self.reset)
         try:
-            self.contextMenu.tk_popup(event.x_root, event.y_root)
+            menu.tk_popup(event.x_root, event.y_root)
         finally:
-            self.contextMenu.grab_release()
+            menu.grab_release()
+
+    @property
+    def contextMenu(self):
+        """
+        - kept for compatibility; shared by all entries of the window, so changes affect every entry
+        """
+        return self._get_context_menu()
+
+    def _get_context_menu(self):
+        """
+        - rebuilt when the window it belongs to is gone, e.g., after the root is recreated
+        """
+        menu, top = Globals.entryMenu, self.winfo_toplevel()
+        # check ownership first: querying a menu of a destroyed root raises
+        if menu is not None and menu.master is top and menu.winfo_exists():
+            return menu
+        Globals.entryMenu = menu = tk.Menu(top, tearoff=0, bg='#333', fg='#DDD', bd=1, relief='flat', activebackground='#444', activeforeground='#FFF')
+        menu.add_command(label="Help")
+        menu.add_command(label="Reset")
+        return menu
 
     def set_tracer(self, handler):
         """
@@ -545,8 +746,14 @@ class Entry(ttk.Frame):
           - var: tk.Variable object
           - index: index of the variable
           - mode: 'read' (triggered when var is read), 'write'(triggered when var is written), 'unset'
+        - subclasses whose model var differs from self.data override get_traced_var() instead of this
+        - one Tk trace per handler: bind the shared forwarder rather than building a closure per var
         """
-        self.data.trace_add('write', callback=lambda name, index, mode, var=self.data: handler(name, var, index, mode))
+        var = self.get_traced_var()
+        var.trace_add('write', callback=functools.partial(_forward_trace, handler, var))
+
+    def get_traced_var(self):
+        return self.data
 
     def validate_data(self):
         print(f'{self.__class__}: subclass data validation: call this when out of focus and submitting the form')
@@ -563,13 +770,13 @@ class FormMenu(tk.Menu):
         self.fileMenu.add_command(label="Load Preset ...", command=self.on_load_preset)
         self.fileMenu.add_command(label="Save Preset ...", command=self.on_save_preset)
         self.fileMenu.add_command(label="Quit", command=self.on_quit, accelerator="Ctrl+Q")
-        self.master.bind("<Control-q>", lambda event: self.on_quit())
-        self.master.bind("<Control-Q>", lambda event: self.on_quit())
+        self.master.bind("<Control-q>", self.on_quit)
+        self.master.bind("<Control-Q>", self.on_quit)
         self.helpMenu = tk.Menu(self, tearoff=False, bg='#333', fg='#DDD', bd=1, relief='flat', activebackground='#444', activeforeground='#FFF')
         self.helpMenu.add_command(label="Open User Guide", command=self.on_open_help, accelerator="F1")
         self.helpMenu.add_command(label="Open Diagnostics", command=self.on_open_diagnostics)
         self.helpMenu.add_command(label="Report A Problem", command=self.on_report_issue)
-        self.master.bind("<F1>", lambda event: self.on_open_help())
+        self.master.bind("<F1>", self.on_open_help)
         self.add_cascade(label="File", menu=self.fileMenu)
         self.add_cascade(label="Help", menu=self.helpMenu)
 
@@ -589,7 +796,7 @@ class FormMenu(tk.Menu):
         if preset:
             self.controller.save_preset(preset)
 
-    def on_open_help(self):
+    def on_open_help(self, event=None):
         self.controller.on_open_help()
 
     def on_open_diagnostics(self):
@@ -598,8 +805,8 @@ class FormMenu(tk.Menu):
     def on_report_issue(self):
         self.controller.on_report_issue()
 
-    def on_quit(self):
-        self.controller.on_quit(None)
+    def on_quit(self, event=None):
+        self.controller.on_quit(event)
 
 
 class FormController:
@@ -609,26 +816,32 @@ class FormController:
     - form apps can use submit() to update model
     - realtime apps can set arg-tracers
     - model and app-config share the same keys
-    - backend task works in task thread
+    - backend task works in a single reusable worker thread fed by a task queue
+      - the worker outlives its tasks, so check is_task_running() for busy state instead of taskWorker.is_alive()
+      - taskWorker replaces the former per-task taskThread
     - progressbar and task synchronize via threading.Event
     """
-
     def __init__(self, form=None, model=None):
         self.form = form
         self.model = model
-        self.set_progress = lambda title, progress, description: Globals.progressQueue.put((title, progress, description))
-        self.taskThread = None
+        self.set_progress = self._post_progress
+        # resolved here on the ui thread, so that the task thread posts without a Tcl query
+        self.progressTarget = form.winfo_toplevel() if form is not None else None
+        self.taskWorker = None
+        self.taskQueue = queue.SimpleQueue()
+        self.taskIdleEvent = threading.Event()
+        self.taskIdleEvent.set()
         self.taskStopEvent = Globals.taskStopEvent
+        # helper thread that blocks until the worker goes idle, then wakes the ui via <<TaskDone>>
+        self.taskWaiter = None
+        self.taskDoneCallbacks = []
+        self._prompt = None
 
     def validate_form(self):
         return self.form.validate_entries()
 
     def update_model(self):
-        config_by_page = {
-            pg.get_title(): {entry.key: entry.get_data() for entry in pg.winfo_children()}
-            for title, pg in self.form.pages.items()
-        }
-        self.model = {k: v for entries in config_by_page.values() for k, v in entries.items()}
+        self.model = {entry.key: entry.get_data() for pg in self.form.pages.values() for entry in pg.entries}
 
     def update_view(self):
         self.load_preset(self.model)
@@ -638,16 +851,18 @@ class FormController:
         - model includes input and config
         - input is runtime data that changes with each run
         - only config will be saved/loaded as preset
+        - a preset may cover a subset of entries, so walk the preset instead of the form
         """
         config = util.load_json(preset) if isinstance(preset, str) else preset
-        for title, page in self.form.pages.items():
-            for entry in page.winfo_children():
-                try:
-                    entry.set_data(config[entry.key])
-                except KeyError as e:
-                    util.glogger.error(f'{entry.key=}, {entry.data.get()=}, {self.model=}: {e}')
-                except Exception as e:
-                    util.glogger.error(f'{entry.key=}, {entry.data.get()=}, {self.model=}: {e}')
+        entry_by_key = self.form.entryByKey
+        for key, value in config.items():
+            if (entry := entry_by_key.get(key)) is None:
+                util.glogger.debug(f'{key=} in preset has no entry; skipped')
+                continue
+            try:
+                entry.set_data(value)
+            except Exception as e:
+                util.glogger.error(f'{entry.key=}, {entry.data.get()=}, {self.model=}: {e}')
 
     def save_preset(self, preset):
         """
@@ -655,16 +870,27 @@ class FormController:
         - input always belongs to group "input"
         - in app-config, if user specifies title, then the title is used with presets (titlecase) instead of the original key (lowercase)
         """
-        config_by_page = {
-            pg.get_title(): {entry.key: entry.get_data() for entry in pg.winfo_children() if entry.isPresetable}
-            for title, pg in self.form.pages.items()
-        }
-        config = {k: v for entries in config_by_page.values() for k, v in entries.items()}
+        config = {entry.key: entry.get_data() for pg in self.form.pages.values() for entry in pg.entries if entry.isPresetable}
         util.save_json(preset, config)
 
     def is_scheduled_to_stop(self):
         return self.taskStopEvent.is_set()
 
+    def _post_progress(self, title, progress, description):
+        """
+        - queue the message, then wake the progressbar
+        - progressbars listen on their toplevel, so post to the form's; root stands in for a form-less controller
+        - safe from the task thread: tkinter forwards the call to the ui thread
+        - a window torn down mid-task, or never built, must not crash the task; the bar's watchdog drains the queue anyway
+        """
+        Globals.progressQueue.put((title, progress, description))
+        if (target := self.progressTarget or Globals.root) is None:
+            return
+        try:
+            target.event_generate('<<Progress>>', when='tail')
+        except (tk.TclError, RuntimeError):
+            pass
+
     def start_progress(self):
         self.set_progress('/start', 0, 'Processing ...')
 
@@ -674,6 +900,27 @@ class FormController:
         """
         self.set_progress('/stop', 100, 'Stopped')
 
+    @property
+    def prompt(self):
+        """
+        - share the form's prompt so that the controller never shows dialogs through a second one
+        - one assigned by the app wins
+        - a controller without a form creates its own on first use, by then root exists
+        """
+        if self._prompt is not None:
+            return self._prompt
+        if self.form is not None:
+            return self.form.prompt
+        self._prompt = Prompt()
+        return self._prompt
+
+    @prompt.setter
+    def prompt(self, prompt):
+        """
+        - e.g., a custom logger; takes precedence over the form's prompt
+        """
+        self._prompt = prompt
+
     def get_latest_model(self):
         """
         - for easy consumption of client objects as arg
@@ -681,10 +928,40 @@ class FormController:
         self.update_model()
         return types.SimpleNamespace(**self.model)
 
-    def wait_for_task(self, wait_ms=100):
-        if self.taskThread.is_alive():
-            # Schedule this method to be called again after wait_ms milliseconds
-            self.form.after(wait_ms, self.wait_for_task)
+    def is_task_running(self):
+        return not self.taskIdleEvent.is_set()
+
+    def wait_for_task(self, wait_ms=100, *, on_done=None):
+        """
+        - on_done runs once on the ui thread after the task has finished
+        - wait_ms is kept for compatibility only; there is no polling interval anymore
+        - no timer: one helper thread blocks on the worker's idle event and posts <<TaskDone>> when it is set
+        - concurrent waits share the same helper
+        """
+        if not self.is_task_running():
+            if on_done:
+                on_done()
+            return
+        if on_done:
+            self.taskDoneCallbacks.append(on_done)
+        if self.taskWaiter and self.taskWaiter.is_alive():
+            return
+        Globals.root.bind('<<TaskDone>>', self._on_task_done)
+        self.taskWaiter = threading.Thread(target=self._await_task_done, daemon=True)
+        self.taskWaiter.start()
+
+    def _await_task_done(self):
+        self.taskIdleEvent.wait()
+        try:
+            Globals.root.event_generate('<<TaskDone>>', when='tail')
+        except (tk.TclError, RuntimeError):
+            # window is gone, nobody to notify
+            pass
+
+    def _on_task_done(self, event=None):
+        callbacks, self.taskDoneCallbacks = self.taskDoneCallbacks, []
+        for cb in callbacks:
+            cb()
 
     #
     # callbacks
@@ -694,7 +971,7 @@ class FormController:
         - open help doc, e.g., webpage, local file
         - subclass this for your own 
         """
-        self.info('Help not implemented yet; implement it in controller subclasses', confirm=True)
+        self.prompt.info('Help not implemented yet; implement it in controller subclasses', confirm=True)
 
     def on_open_diagnostics(self):
         """
@@ -703,14 +980,14 @@ class FormController:
         - e.g., opening a log file using the default browser
         - e.g., opening a folder containing the entire diagnostics
         """
-        self.info('Logging not implemented yet; implement it in controller subclasses', confirm=True)
+        self.prompt.info('Logging not implemented yet; implement it in controller subclasses', confirm=True)
 
     def on_report_issue(self):
         """
         - report bug to the developer
         - subclass this
         """
-        self.info('Bug reporting not implemented yet; implement it in controller subclasses', confirm=True)
+        self.prompt.info('Bug reporting not implemented yet; implement it in controller subclasses', confirm=True)
 
     def on_reset(self):
         """
@@ -724,16 +1001,32 @@ class FormController:
         - main action to launch the background task
         - usually can be used as is, no need to override
         """
-        if self.taskThread and self.taskThread.is_alive():
+        if self.is_task_running():
             return
         if not self.validate_form():
             return
         self.update_model()
         self.taskStopEvent.clear()
-        # lambda wrapper ensures "self" is captured by threading as a context
-        # otherwise ui thread still blocks
-        self.taskThread = threading.Thread(target=lambda: self.run_task(), daemon=True)
-        self.taskThread.start()
+        # mark busy on ui thread before queueing so that a quick re-submit cannot slip through
+        self.taskIdleEvent.clear()
+        if self.taskWorker is None:
+            self.taskWorker = threading.Thread(target=self._worker_loop, name='form-task', daemon=True)
+            self.taskWorker.start()
+        self.taskQueue.put(self.run_task)
+
+    def _worker_loop(self):
+        """
+        - long-lived worker: spawned on first submit and reused for every later run
+        - a failing task must not kill the worker, so log it and go idle
+        """
+        while True:
+            task = self.taskQueue.get()
+            try:
+                task()
+            except Exception as e:
+                util.glogger.exception(f'Task failed: {e}')
+            finally:
+                self.taskIdleEvent.set()
 
     def run_task(self):
         """
@@ -746,7 +1039,7 @@ class FormController:
         """
         - cancelling a running background task
         """
-        if self.taskThread and self.taskThread.is_alive():
+        if self.is_task_running():
             self.taskStopEvent.set()
             self.wait_for_task()
 
@@ -774,13 +1067,12 @@ class FormController:
         - safely schedules shutdown with prompt and early-outs if user cancels
         - subclass this for post-ops
         """
-        if not self.taskThread or not self.taskThread.is_alive():
+        if not self.is_task_running():
             # task not running, safe to continue to quit
             self.taskStopEvent.set()  # progressbar needs to be stopped
             return True
-        prompt = Prompt()
         # Make default behavior a safe bet
-        if prompt.warning('Quitting a running task may cause damage. Click Yes to wait for it to finish, or No to force-quit', 'Wait for it to finish.', question='Keep waiting?', confirm=True):
+        if self.prompt.warning('Quitting a running task may cause damage. Click Yes to wait for it to finish, or No to force-quit', 'Wait for it to finish.', question='Keep waiting?', confirm=True):
             # user decided to wait
             return False
         self.taskStopEvent.set()  # progressbar needs to be stopped
@@ -807,13 +1099,13 @@ class FormController:
             self.on_quit()
 
     def info(self, msg, confirm=True):
-        self.form.prompt.info(msg, confirm)
+        self.prompt.info(msg, confirm)
 
     def warning(self, detail, advice, question='Continue?', confirm=True):
-        return self.form.prompt.warning(detail, advice, question, confirm)
+        return self.prompt.warning(detail, advice, question, confirm)
 
     def error(self, errclass, detail, advice, confirm=True):
-        return self.form.prompt.error(errclass, detail, advice, confirm)
+        return self.prompt.error(errclass, detail, advice, confirm)
 
 
 class FormActionBar(ttk.Frame):
@@ -866,6 +1158,24 @@ class WaitBar(ttk.Frame):
         self.bar = ttk.Progressbar(self, orient="horizontal", mode="indeterminate")
         self.label = ttk.Label(self.bar, textvariable=self.stage, text='...', foreground='white', background='black')
         self.taskStopEvent = Globals.taskStopEvent
+        # instruction -> handler(progress, description); subclasses extend this instead of rewriting the drain loop
+        self.handlers = {'/start': self._on_start, '/stop': self._on_stop}
+        self.pendingRunning = None
+        # what the task asked for; the animation timer itself only runs while the bar is on screen
+        self.isRunning = False
+        # the bar itself gets no <Unmap> when its window is minimized, so also watch the toplevel
+        self.toplevel = self.winfo_toplevel()
+        self.bar.bind('<Unmap>', self._on_bar_unmapped, add='+')
+        self.bar.bind('<Map>', self._on_bar_mapped, add='+')
+        # task thread wakes us through this event instead of us polling the queue
+        # - the controller posts it to the form's toplevel, which is ours too
+        # - toplevel bindings outlive the bar, so they are removed on <Destroy>
+        self.toplevelBindings = [(seq, self.toplevel.bind(seq, handler, add='+')) for seq, handler in (
+            ('<Unmap>', self._on_bar_unmapped),
+            ('<Map>', self._on_bar_mapped),
+            ('<<Progress>>', self._on_progress_posted),
+        )]
+        self.bind('<Destroy>', self._on_destroyed, add='+')
         self.layout()
 
     def layout(self):
@@ -876,27 +1186,91 @@ class WaitBar(ttk.Frame):
         self.label.place(relx=0.5, rely=0.5, anchor='center')
         self.pack(side='bottom', fill='both', expand=False)
 
-    def poll(self, wait_ms=100):
+    def poll(self, wait_ms=None, *, watchdog_ms=1000, _interval_ms=None):
         """
-        - app pushes special messages to mark progress start/stop
+        - call once after creation to start consuming progress
+        - updates normally arrive via <<Progress>>, posted by the controller for each message
+        - the timer is only a safety net for posts lost while the window was not mapped yet
+        - it backs off: if it finds leftovers, posts are being lost, so re-check soon; else double up to watchdog_ms
+        - wait_ms: former fixed polling interval, now taken as the watchdog's longest interval
         """
-        while self.queue.qsize():
-            if self._is_scheduled_to_stop():
-                return
-            msg = self.queue.get(0)
-            cmd = msg[0]
-            # CAUTION:
-            # - .start() and .stop() are used for indeterminate progress bars only
-            # - use .set() with determinate bars
-            if cmd == '/start':
-                self.bar.start()
-                self.master.update_idletasks()
-            elif cmd == '/stop':
-                self.bar.stop()
-                self.master.update_idletasks()
-            else:
+        if wait_ms is not None:
+            watchdog_ms = wait_ms
+        interval = _interval_ms or watchdog_ms
+        interval = 20 if self._drain() else min(interval * 2, watchdog_ms)
+        self.after(interval, lambda: self.poll(watchdog_ms=watchdog_ms, _interval_ms=interval))
+
+    def _on_progress_posted(self, event):
+        self._drain()
+
+    def _on_destroyed(self, event):
+        # <Destroy> also arrives for each child
+        if event.widget is not self:
+            return
+        for seq, funcid in self.toplevelBindings:
+            _unbind(self.toplevel, seq, funcid)
+        self.toplevelBindings = []
+
+    def _drain(self):
+        """
+        - app pushes special messages to mark progress start/stop
+        - drain everything queued since last wakeup; handlers only record state
+        - then render once, so the bar never lags behind a fast task
+        - return whether anything was drained
+        """
+        drained = False
+        # bursts can queue hundreds of messages, so resolve attributes once
+        q, is_stopping, handlers = self.queue, self._is_scheduled_to_stop, self.handlers
+        # single consumer: a non-zero size guarantees get_nowait() succeeds, so no Empty is raised per wakeup
+        while q.qsize():
+            if is_stopping():
+                return False
+            cmd, progress, description = q.get_nowait()
+            if (handler := handlers.get(cmd)) is None:
                 raise NotImplementedError(f'Unexpected progress instruction: {cmd}')
-        self.after(wait_ms, self.poll)
+            handler(progress, description)
+            drained = True
+        if drained:
+            self._render()
+        return drained
+
+    def _on_start(self, progress, description):
+        self.pendingRunning = True
+
+    def _on_stop(self, progress, description):
+        self.pendingRunning = False
+
+    def _render(self):
+        """
+        CAUTION:
+        - .start() and .stop() are used for indeterminate progress bars only
+        - use .set() with determinate bars
+        """
+        if self.pendingRunning is None:
+            return
+        self.isRunning = self.pendingRunning
+        self.pendingRunning = None
+        if self.isRunning and not self.bar.winfo_viewable():
+            # <Map> resumes it
+            return
+        self.bar.start() if self.isRunning else self.bar.stop()
+        self.master.update_idletasks()
+
+    def _on_bar_unmapped(self, event):
+        """
+        - a hidden or minimized bar must not keep waking the ui thread for animation
+        - toplevel bindings also fire for its descendants, so react to the bar and the window only
+        """
+        if event.widget not in (self.bar, self.toplevel):
+            return
+        if self.isRunning:
+            self.bar.stop()
+
+    def _on_bar_mapped(self, event):
+        if event.widget not in (self.bar, self.toplevel):
+            return
+        if self.isRunning and self.bar.winfo_viewable():
+            self.bar.start()
 
     def _is_scheduled_to_stop(self):
         return self.taskStopEvent.is_set()
@@ -907,21 +1281,33 @@ class ProgressBar(WaitBar):
         super().__init__(master, progress_queue, *args, **kwargs)
         self.progress = tk.DoubleVar(name='progress', value=0.)
         self.bar.configure(variable=self.progress, mode='determinate')
+        # only the latest progress and text since last wakeup are visible, so handlers just overwrite them
+        self.pendingValue, self.pendingText = None, None
+        # what is on screen, so that repeated values cost no Tcl write
+        self.shownValue, self.shownText = 0., ''
+        self.handlers = {'/start': self._on_stage, '/stop': self._on_stage, '/processing': self._on_processing}
         self.layout()
 
-    def poll(self, wait_ms=100):
+    def _on_stage(self, progress, description):
+        self.pendingText = description
+
+    def _on_processing(self, progress, description):
+        self.pendingValue, self.pendingText = progress, description
+
+    def _render(self):
+        if self.pendingValue is not None and self.pendingValue != self.shownValue:
+            self.shownValue = self.pendingValue
+            self.progress.set(self.shownValue)
+        if self.pendingText is not None and self.pendingText != self.shownText:
+            self.shownText = self.pendingText
+            self.stage.set(self.shownText)  # Update the label text
+        self.pendingValue, self.pendingText = None, None
+
+    def _is_scheduled_to_stop(self):
         """
-        - Periodically check for messages from worker thread.
+        - keep draining after a stop request so that the final /stop text still shows
         """
-        while self.queue.qsize():
-            try:
-                cmd, value, text = self.queue.get_nowait()
-                if cmd == '/processing':
-                    self.progress.set(value)
-                self.stage.set(text)  # Update the label text
-            except queue.Empty:
-                pass
-        self.after(wait_ms, self.poll)
+        return False
 
 
 class NumberEntry(Entry):
@@ -934,20 +1320,43 @@ class NumberEntry(Entry):
         self.field.configure(style='TFrame')
         self.spinbox = ttk.Spinbox(self.field, textvariable=self.data, from_=minmax[0], to=minmax[1], increment=step, style='TSpinbox')
         self.spinbox.grid(row=0, column=0, padx=(0, 5))  # Adjust padx value
-        if not (is_infinite := minmax[0] in (float('-inf'), float('inf')) or minmax[1] in (float('-inf'), float('inf'))):
+        # cache range to spare the slider path Tcl cget round-trips; set_range() keeps it in sync
+        self.minVal, self.maxVal, self.valRange, self.invRange = 0.0, 0.0, 0.0, 0.0
+        self._cache_range(minmax)
+        self.hasSlider = not (is_infinite := minmax[0] in (float('-inf'), float('inf')) or minmax[1] in (float('-inf'), float('inf')))
+        if self.hasSlider:
             self.sliderRatio = tk.DoubleVar(value=(self.data.get() - minmax[0]) / (minmax[1] - minmax[0]))
             self.slider = ttk.Scale(self.field, from_=0.0, to=1.0, orient="horizontal", variable=self.sliderRatio, command=self.on_scale_changed, style='Horizontal.TScale')
             self.slider.grid(row=0, column=1, sticky="ew")
             self.slider.bind("<ButtonRelease-1>", self.on_scale_clicked)
+            # track width on resize so that clicking needs no Tcl query
+            self.sliderWidth = 1
+            self.slider.bind("<Configure>", self._on_slider_configure)
         self.spinbox.bind('<KeyPress>', self.on_start_typing)
         self.spinbox.bind('<KeyRelease>', self.on_stop_typing)
         self.spinbox.bind('<FocusOut>', self.validate_data)
 
     def set_data(self, value):
         self.data.set(value)
-        if hasattr(self, 'sliderRatio'):
+        if self.hasSlider:
+            self._sync_scale_with_spinbox()
+
+    def set_range(self, minmax):
+        """
+        - change range at runtime
+        - slider exists only if the range was finite at construction
+        """
+        self.spinbox.configure(from_=minmax[0], to=minmax[1])
+        self._cache_range(minmax)
+        if self.hasSlider:
             self._sync_scale_with_spinbox()
 
+    def _cache_range(self, minmax):
+        self.minVal, self.maxVal = float(minmax[0]), float(minmax[1])
+        self.valRange = self.maxVal - self.minVal
+        # spinbox->slider sync multiplies; infinite ranges have no slider, and 1/inf is 0 anyway
+        self.invRange = 1.0 / self.valRange if self.valRange else 0.0
+
     def on_start_typing(self, event):
         self.isUserTyping = True
 
@@ -958,17 +1367,18 @@ class NumberEntry(Entry):
         """
         - ignore "write" event while user types into spinbox to avoid invalid data
         - leave validation to out-of-focus event
+        - register the filter itself as the Tk callback so each write goes through one wrapper only
         """
 
-        def _mouse_tweak_handler(name, var, index, mode):
+        def _mouse_tweak_handler(name, index, mode, var=self.data):
             if self.isUserTyping:
                 return
             handler(name, var, index, mode)
 
-        self.data.trace_add('write', callback=lambda name, index, mode, var=self.data: _mouse_tweak_handler(name, var, index, mode))
+        self.data.trace_add('write', callback=_mouse_tweak_handler)
 
     def _sync_scale_with_spinbox(self):
-        self.sliderRatio.set((self.data.get() - self.spinbox['from']) / (self.spinbox['to'] - self.spinbox['from']))
+        self.sliderRatio.set((self.data.get() - self.minVal) * self.invRange)
 
     def on_scale_changed(self, ratio):
         raise NotImplementedError('subclass this!')
@@ -980,10 +1390,13 @@ class NumberEntry(Entry):
         - update_idletasks() redraws slider and flush all pending events, thus reflects recent changes in its look
         - otherwise, it may jump b/w left/right ends when clicking
         """
-        relative_x = event.x / (scale_width := self.slider.winfo_width())
+        relative_x = event.x / self.sliderWidth
         self.slider.set(relative_x)
         self.slider.update_idletasks()
 
+    def _on_slider_configure(self, event):
+        self.sliderWidth = max(event.width, 1)
+
     def validate_data(self, event=None):
         """
         - validate after user focuses out (tab key or mouse click into another entry)
@@ -992,12 +1405,12 @@ class NumberEntry(Entry):
         - otherwise reset to default
         """
         value = safe_get_number(self.data)
-        if not util.is_number_text(str(value)):
+        # tk var parsed cleanly in the common case; only fall back to text check on its raw-text result
+        if isinstance(value, str) and not util.is_number_text(value):
             self._alert_and_refocus(value, f'{self.text} ({value}) is not a number')
             return False
         # range check
-        minval = self.spinbox.config('from')[4]
-        maxval = self.spinbox.config('to')[4]
+        minval, maxval = self.minVal, self.maxVal
         try:
             if not (minval <= value <= maxval):
                 self._alert_and_refocus(value, f'{self.text} ({value}) is outside range: [{minval}, {maxval}]')
@@ -1005,12 +1418,12 @@ class NumberEntry(Entry):
         except ValueError as e:
             self._alert_and_refocus(value, f'{self.text} ({value}) triggerd unknown error: {e}')
             return False
-        if hasattr(self, 'sliderRatio'):
+        if self.hasSlider:
             self._sync_scale_with_spinbox()
         return True
 
     def _alert_and_refocus(self, value, err_msg):
-        Globals.root.bell()
+        ring_bell()
         util.alert(err_msg, 'ERROR')
         Globals.root.after(100, lambda: self.spinbox.focus_set())
 
@@ -1027,8 +1440,11 @@ class IntEntry(NumberEntry):
 
     def on_scale_changed(self, ratio):
         try:
-            value_range = self.spinbox['to'] - self.spinbox['from']
-            new_value = int(self.spinbox['from'] + float(ratio) * value_range)
+            new_value = int(self.minVal + float(ratio) * self.valRange)
+            # several slider pixels truncate to the same int; skip the write and its tracers
+            # spinbox may hold unparsable text, which the slider must overwrite rather than choke on
+            if new_value == safe_get_number(self.data):
+                return
             self.data.set(new_value)
         except ValueError as e:
             pass  # Ignore non-integer values
@@ -1037,20 +1453,72 @@ class IntEntry(NumberEntry):
 class FloatEntry(NumberEntry):
     """
     - must NOT inherit from IntEntry to avoid slider malfunction
+    - slider drags are throttled: the first move writes at once, then at most once per debounce_ms, and the last position always lands
+      - the spinbox shows the model, so a pure trailing debounce would freeze its readout during a drag
+    - debounce_ms=0 writes synchronously
+    - a pending position is committed by get_data() and dropped by set_data()/set_range(), so reads and writes never see a stale model
     """
 
-    def __init__(self, master: Page, key, text, default, doc, presetable=True, minmax=(float('-inf'), float('inf')), step=0.1, precision=2, **kwargs):
+    def __init__(self, master: Page, key, text, default, doc, presetable=True, minmax=(float('-inf'), float('inf')), step=0.1, precision=2, debounce_ms=50, **kwargs):
         super().__init__(master, key, text, default, doc, presetable, minmax, tk.DoubleVar, step, **kwargs)
         self.precision = precision
+        # quantize by integer rounding instead of formatting to a string and parsing it back
+        self.quant = 10 ** precision
+        self.debounceMs = debounce_ms
+        # end of the current throttle window
+        self.pendingCommit = None
+        # latest slider position not written yet
+        self.pendingValue = None
+
+    def get_data(self):
+        if self.pendingValue is not None:
+            self.data.set(self.pendingValue)
+            self.pendingValue = None
+        return self.data.get()
+
+    def set_data(self, value):
+        self._cancel_pending_commit()
+        super().set_data(value)
+
+    def set_range(self, minmax):
+        self._cancel_pending_commit()
+        super().set_range(minmax)
 
     def on_scale_changed(self, ratio):
         try:
-            value_range = self.spinbox['to'] - self.spinbox['from']
-            new_value = self.spinbox['from'] + float(ratio) * value_range
-            formatted_value = "{:.{}f}".format(float(new_value), self.precision)
-            self.data.set(float(formatted_value))
+            new_value = round((self.minVal + float(ratio) * self.valRange) * self.quant) / self.quant
         except ValueError:
-            pass
+            return
+        # a newer slider position always supersedes the pending one, even if it lands back on the current value
+        if new_value == safe_get_number(self.data):
+            self.pendingValue = None
+            return
+        if not self.debounceMs:
+            self.data.set(new_value)
+            return
+        if self.pendingCommit:
+            # window is open: its end writes the latest position
+            self.pendingValue = new_value
+            return
+        # leading edge
+        self.data.set(new_value)
+        self.pendingCommit = self.after(self.debounceMs, self._commit_scale_value)
+
+    def _commit_scale_value(self):
+        """
+        - trailing edge: write the latest position and keep throttling while the drag goes on
+        """
+        self.pendingCommit = None
+        if (value := self.pendingValue) is None:
+            return
+        self.pendingValue = None
+        self.data.set(value)
+        self.pendingCommit = self.after(self.debounceMs, self._commit_scale_value)
+
+    def _cancel_pending_commit(self):
+        if self.pendingCommit:
+            self.after_cancel(self.pendingCommit)
+        self.pendingCommit, self.pendingValue = None, None
 
 
 class SingleOptionEntry(Entry):
@@ -1061,6 +1529,10 @@ class SingleOptionEntry(Entry):
 
     def __init__(self, master: Page, key, text, options, default, doc, presetable=True, **kwargs):
         super().__init__(master, key, text, ttk.Combobox, default, doc, presetable, values=options, **kwargs)
+        # python-side copy of the options spares each selection a Tcl cget and a linear search
+        self.options = ()
+        self.optionIndex = {}
+        self._cache_options(options)
         # model-binding
         self.data = self._init_data(tk.StringVar)
         self.field.configure(textvariable=self.data, state='readonly', style='TCombobox')
@@ -1075,30 +1547,44 @@ class SingleOptionEntry(Entry):
         self.index.set(new_index)
 
     def get_options(self):
-        return self.field.cget('values')
+        return self.options
+
+    def set_options(self, options):
+        """
+        - keep the cache in sync when options change at runtime
+        """
+        self._cache_options(options)
+        self.field.configure(values=self.options)
+
+    def _cache_options(self, options):
+        self.options = tuple(options)
+        self.optionIndex = {opt: i for i, opt in enumerate(self.options)}
 
     def get_selection_index(self):
-        # Get the current value from self.data
-        current_value = self.data.get()
-        try:
-            # Return the index of the current value in the options list
-            return self.get_options().index(current_value)
-        except ValueError:
-            # If current value is not in the options list, return -1 or handle appropriately
-            return -1
-        # return self.get_options().index(self.data.get())
+        # -1 if current value is not in the options list
+        return self.optionIndex.get(self.data.get(), -1)
 
-    def set_tracer(self, handler):
-        self.index.trace_add('write', callback=lambda name, idx, mode, var=self.index: handler(name, var, idx, mode))
+    def get_traced_var(self):
+        return self.index
 
     def validate_data(self):
         return True
 
 
 class MultiOptionEntry(Entry):
+    """
+    - model is a single bitmask over options, so that bulk selection notifies tracers once instead of once per option
+    - per-option BooleanVars only drive the checkbutton rendering and are never traced
+    - tracer's var is the bitmask IntVar
+    """
+    # menu rows before the options: select-all and select-none
+    _optionRowStart = 2
+
     def __init__(self, master: Page, key, text, options, default, doc, presetable=True, **kwargs):
         super().__init__(master, key, text, ttk.Menubutton, default, doc, presetable, **kwargs)
         self.data = {opt: tk.BooleanVar(name=opt, value=opt in default) for opt in options}
+        self.optionBits = {opt: 1 << i for i, opt in enumerate(options)}
+        self.mask = tk.IntVar(master=self, value=self._to_mask(default))
         self.field.configure(text='Select one ore more ...')
         # build option menu
         self.selectAll = tk.BooleanVar(name='All', value=True)
@@ -1114,26 +1600,69 @@ class MultiOptionEntry(Entry):
         """
         - selected subset
         """
-        return [opt for opt in filter(lambda k: self.data[k].get() == 1, self.data.keys())]
+        mask = self.mask.get()
+        return [opt for opt, bit in self.optionBits.items() if mask & bit]
 
     def set_data(self, values):
         """
         - serialized data: selected subset
         """
-        for opt in self.data:
-            self.data[opt].set(opt in values)
+        self._apply_mask(self._to_mask(values))
 
     def _select_all(self):
-        for k, v in self.data.items():
-            v.set(True)
+        self._apply_mask((1 << len(self.optionBits)) - 1)
 
     def _select_none(self):
-        for k, v in self.data.items():
-            v.set(False)
+        self._apply_mask(0)
 
-    def set_tracer(self, handler):
-        for opt in self.data:
-            self.data[opt].trace_add('write', callback=lambda name, idx, mode, var=self.data[opt]: handler(name, var, idx, mode))
+    def _apply_mask(self, new_mask):
+        """
+        - touch only the checkbuttons whose state flips, then notify tracers once
+        - an unchanged selection notifies no one
+        """
+        if not (flipped := self.mask.get() ^ new_mask):
+            return
+        for opt, bit in self.optionBits.items():
+            if flipped & bit:
+                self.data[opt].set(bool(new_mask & bit))
+        self.mask.set(new_mask)
+
+    def _to_mask(self, values):
+        # presets hand in lists; look bits up by value rather than scanning the list per option
+        bits = self.optionBits
+        return sum(bits[opt] for opt in set(values) if opt in bits)
+
+    def _toggle_option(self, opt):
+        self.mask.set(self.mask.get() ^ self.optionBits[opt])
+
+    def get_traced_var(self):
+        return self.mask
+
+    def set_options(self, options, selected=()):
+        """
+        - replace options at runtime; selection is reset to the given subset
+        - existing menu rows are relabelled in place; only the difference in row count is added or deleted
+        - vars are named after their options, so surviving options must keep their var objects:
+          a dropped duplicate would unset the shared Tcl variable when garbage-collected
+        """
+        old_count = len(self.optionBits)
+        old_data = self.data
+        self.data = {}
+        for opt in options:
+            if (var := old_data.get(opt)) is None:
+                var = tk.BooleanVar(name=opt)
+            var.set(opt in selected)
+            self.data[opt] = var
+        self.optionBits = {opt: 1 << i for i, opt in enumerate(options)}
+        for i, opt in enumerate(self.data):
+            row = i + self._optionRowStart
+            if i < old_count:
+                self.menu.entryconfigure(row, label=opt, variable=self.data[opt], command=functools.partial(self._toggle_option, opt))
+            else:
+                self._add_option_row(opt)
+        if len(self.data) < old_count:
+            self.menu.delete(len(self.data) + self._optionRowStart, 'end')
+        self.mask.set(self._to_mask(selected))
 
     def _build_options(self):
         # keep the order
@@ -1142,7 +1671,10 @@ class MultiOptionEntry(Entry):
         self.menu.add_command(label='- None -',
                               command=self._select_none)
         for opt in self.data:
-            self.menu.add_checkbutton(label=opt, variable=self.data[opt], onvalue=True, offvalue=False)
+            self._add_option_row(opt)
+
+    def _add_option_row(self, opt):
+        self.menu.add_checkbutton(label=opt, variable=self.data[opt], onvalue=True, offvalue=False, command=functools.partial(self._toggle_option, opt))
 
     def validate_data(self):
         return True
@@ -1159,13 +1691,23 @@ class BoolEntry(Entry):
 
 
 class TextEntry(Entry):
-    def __init__(self, master: Page, key, text, default, doc, presetable=True, **kwargs):
-        """there is no ttk.Text"""
+    def __init__(self, master: Page, key, text, default, doc, presetable=True, debounce_ms=150, **kwargs):
+        """
+        - there is no ttk.Text
+        - typing is debounced: the model is written once the user pauses for debounce_ms, or leaves the field
+        - debounce_ms=0 writes on the next event-loop turn after each edit
+        - edits come from key releases and clipboard events, both routed into the same debounced handler
+        """
 
         super().__init__(master, key, text, tktext.ScrolledText, default, doc, presetable, height=4, wrap=tk.WORD, undo=True, **kwargs)
         self.data = self._init_data(tk.StringVar)
+        self.debounceMs = debounce_ms
+        self.pendingFlush = None
         self.field.bind("<KeyRelease>", self._on_text_changed)
-        self.field.bind("<FocusOut>", self._on_text_changed)
+        # widget bindings run before the class binding that edits the text, hence always deferring the read
+        self.field.bind("<<Paste>>", self._on_text_changed)
+        self.field.bind("<<Cut>>", self._on_text_changed)
+        self.field.bind("<FocusOut>", self._flush_text_to_model)
         cmd_key = 'Command' if util.PLATFORM == 'Darwin' else 'Control'
         self.field.bind(f"<{cmd_key}-z>", lambda event: self.undo())
         self.field.bind(f"<Control-y>", lambda event: self.redo())
@@ -1182,10 +1724,23 @@ class TextEntry(Entry):
         self.secondaryBtn.pack(side='left', padx=5, anchor="w")
         # helper
         self.lastContent = default
+        # unstripped buffer as of the last flush, so flushing an untouched buffer skips the strip
+        self.lastRaw = None
         # CAUTION: no way to customize the scrollbar color
         # self.field.vbar['troughcolor'] = '#222'
         self.field.configure(foreground='white', background='#222', insertbackground='white', insertwidth=2)
 
+    def set_data(self, value):
+        """
+        - programmatic writes, e.g., reset and presets, win over edits not flushed yet
+        - forget what the view showed, so that even a write of the last committed value redraws it
+        """
+        if self.pendingFlush:
+            self.after_cancel(self.pendingFlush)
+            self.pendingFlush = None
+        self.lastContent, self.lastRaw = None, None
+        self.data.set(value)
+
     def undo(self):
         try:
             self.field.edit_undo()
@@ -1201,29 +1756,58 @@ class TextEntry(Entry):
     def _on_data_changed(self, *args):
         """
         - update view on model changes
+        - lastContent is what the view last showed or committed, so a match means the view is already current
+        - skipping then spares copying the whole buffer out of Tcl
         """
-        self.lastContent = self.data.get()
-        if self.field.get("1.0", tk.END).strip() != self.lastContent:
+        if (to_see := self.data.get()) == self.lastContent:
+            return
+        self.lastContent = to_see
+        # view is about to diverge from the last flushed buffer
+        self.lastRaw = None
+        if self.field.get("1.0", tk.END).strip() != to_see:
             self.field.delete("1.0", tk.END)
-            self.field.insert("1.0", self.lastContent)
+            self.field.insert("1.0", to_see)
+
+    def get_data(self):
+        """
+        - submitting right after typing must not read a stale model
+        """
+        if self.pendingFlush:
+            self._flush_text_to_model()
+        return self.data.get()
 
     def _on_text_changed(self, event):
         """
-        - update model on user editing
+        - update model on user editing, once typing pauses
+        """
+        if self.pendingFlush:
+            self.after_cancel(self.pendingFlush)
+        self.pendingFlush = self.after(self.debounceMs, self._flush_text_to_model)
+
+    def _flush_text_to_model(self, event=None):
+        """
         - must avoid feedback loop when text changes are caused by model changes
         """
-        current_text = self.field.get("1.0", tk.END).strip()
+        if self.pendingFlush:
+            self.after_cancel(self.pendingFlush)
+            self.pendingFlush = None
+        if (current_raw := self.field.get("1.0", tk.END)) == self.lastRaw:
+            # e.g., navigation keys or focus changes: nothing was edited
+            return
+        self.lastRaw = current_raw
+        current_text = current_raw.strip()
         if self.lastContent != current_text:
-            self.data.set(current_text)
+            # record first so that the write-trace back into _on_data_changed short-circuits
             self.lastContent = current_text
+            self.data.set(current_text)
 
     def on_primary_action(self):
         """
         - replace entry text with clipboard content
         """
-        # clear the text field first
-        self.field.delete("1.0", tk.END)
-        self.field.insert(tk.INSERT, self.field.clipboard_get())
+        # one widget mutation, then one model write
+        self.field.replace("1.0", tk.END, self.field.clipboard_get())
+        self._flush_text_to_model()
 
     def on_secondary_action(self):
         """
@@ -1233,32 +1817,56 @@ class TextEntry(Entry):
         self.field.clipboard_append(self.field.get("1.0", tk.END).strip())
 
 
-class FileEntry(TextEntry):
+class _PathEntry(TextEntry):
     """
-    - user can type in a list of paths as text lines, one per line
-    - to specify a default file-extension, place it as the head of file_patterns
-    - always return a list even when there is only one; so use self.data[0] on app side for a single-file case
+    - shared by FileEntry and FolderEntry: text lines as paths, parsed once per model write
     """
 
-    def __init__(self, master: Page, key, path, default, doc, presetable=True, file_patterns=(), start_dir=util.get_platform_home_dir(), **kwargs):
+    def __init__(self, master: Page, key, path, default, doc, presetable=True, start_dir=None, **kwargs):
         super().__init__(master, key, path, default, doc, presetable, **kwargs)
-        self.filePats = file_patterns
-        self.startDir = start_dir
-        self._fix_platform_patterns()
-        self.primaryBtn.configure(text='Browse ...')
-        self.secondaryBtn.configure(text='Open')
+        # parsed paths, dropped whenever the model is written
+        self.pathCache = None
+        self.data.trace_add('write', self._invalidate_path_cache)
+        # resolved per instance rather than at import time as a default arg
+        self.startDir = start_dir if start_dir is not None else util.get_platform_home_dir()
 
     def get_data(self):
         """
         - adapt to single path or path collection
+        - return a fresh list so that callers cannot corrupt the cache
         """
-        paths = self.data.get().splitlines()
-        return paths[0] if len(paths) == 1 else paths
+        if self.pendingFlush:
+            self._flush_text_to_model()
+        if self.pathCache is None:
+            self.pathCache = tuple(self.data.get().splitlines())
+        paths = self.pathCache
+        return paths[0] if len(paths) == 1 else list(paths)
+
+    def _invalidate_path_cache(self, *args):
+        self.pathCache = None
 
     def set_data(self, value: typing.Union[list[str], tuple[str], str]):
-        data = value[0] if isinstance(value, list) and len(value) == 1 else value
-        self.data.set('\n'.join(data)) if isinstance(data, list) else self.data.set(value)
-        self._on_data_changed()
+        data = value[0] if isinstance(value, (list, tuple)) and len(value) == 1 else value
+        paths = tuple(data) if isinstance(data, (list, tuple)) else tuple(data.splitlines())
+        # single write; its trace already refreshes the view and drops the cache
+        super().set_data('\n'.join(paths))
+        # caller already handed us the paths, so spare the next get_data a re-split
+        self.pathCache = paths
+
+
+class FileEntry(_PathEntry):
+    """
+    - user can type in a list of paths as text lines, one per line
+    - to specify a default file-extension, place it as the head of file_patterns
+    - always return a list even when there is only one; so use self.data[0] on app side for a single-file case
+    """
+
+    def __init__(self, master: Page, key, path, default, doc, presetable=True, file_patterns=(), start_dir=None, **kwargs):
+        super().__init__(master, key, path, default, doc, presetable, start_dir, **kwargs)
+        self.filePats = file_patterns
+        self._fix_platform_patterns()
+        self.primaryBtn.configure(text='Browse ...')
+        self.secondaryBtn.configure(text='Open')
 
     def reset(self):
         lst = self.default if isinstance(self.default, (list, tuple)) else [self.default]
@@ -1266,21 +1874,20 @@ class FileEntry(TextEntry):
 
     def on_primary_action(self):
         preferred_ext = self.filePats[pattern := 0][ext := 1]
-        selected = filedialog.askopenfilename(
+        # plural variant: the singular one never returns more than one file
+        selected = filedialog.askopenfilenames(
             parent=self,
             title="Select File(s)",
             initialdir=self.startDir,
             filetypes=self.filePats,
             defaultextension=preferred_ext
         )
-        if user_cancelled := selected == '':
+        if user_cancelled := not selected:
             # keep current
             return
-        if multi_selection := isinstance(selected, (tuple, list)):
-            selected = '\n'.join(selected)
-        self.data.set(selected)
+        self.set_data(list(selected))
         # memorize last selected file's folder
-        self.startDir = osp.dirname(selected)
+        self.startDir = osp.dirname(selected[-1])
 
     def on_secondary_action(self):
         """
@@ -1295,7 +1902,7 @@ class FileEntry(TextEntry):
             return
         # multiple files
         drvwise_dirs = util.get_drivewise_commondirs(files)
-        for d in drvwise_dirs.value():
+        for d in drvwise_dirs.values():
             util.open_in_editor(d)
 
     def _fix_platform_patterns(self):
@@ -1310,27 +1917,16 @@ class FileEntry(TextEntry):
         self.filePats = tuple([self.filePats[0], ('All Files', '*')])
 
 
-class FolderEntry(TextEntry):
+class FolderEntry(_PathEntry):
     """
     - tkinter supports single-folder selection only
     - multiple folders can be pasted into the text field
     """
 
-    def __init__(self, master: Page, key, path, default, doc, presetable=True, start_dir=util.get_platform_home_dir(), **kwargs):
-        super().__init__(master, key, path, default, doc, presetable, **kwargs)
-        self.startDir = start_dir
+    def __init__(self, master: Page, key, path, default, doc, presetable=True, start_dir=None, **kwargs):
+        super().__init__(master, key, path, default, doc, presetable, start_dir, **kwargs)
         self.primaryBtn.configure(text='Browse ...')
 
-    def get_data(self):
-        paths = self.data.get().splitlines()
-        return paths[0] if len(paths) == 1 else paths
-
-    def set_data(self, value: typing.Union[list[str], tuple[str], str]):
-        data = value[0] if isinstance(value, list) and len(value) == 1 else value
-        self.data.set('\n'.join(data)) if isinstance(data, list) else self.data.set(value)
-        self._on_data_changed()
-        print(f'set_data: {self.text=}, {value=}\n')
-
     def on_primary_action(self):
         selected = filedialog.askdirectory(
             parent=self,
@@ -1404,7 +2000,7 @@ class ReadOnlyPathEntry(ReadOnlyEntry):
             return
         # multiple files
         drvwise_dirs = util.get_drivewise_commondirs(files)
-        for d in drvwise_dirs.value():
+        for d in drvwise_dirs.values():
             util.open_in_editor(d)
 
 
@@ -1443,15 +2039,19 @@ class ListEntry(Entry):
         self.menu.add_command(label="Load ...", command=self.on_load)
         self.menu.add_command(label="Save ...", command=self.on_save)
         self.menubtnSaveLoad.pack(side=tk.LEFT)
+        # large list files are inserted in chunks across idle ticks; this is the next chunk's callback id
+        self.pendingLoad = None
         self.reset()
 
     def get_data(self):
         return list(self.listBox.get(0, tk.END))
 
     def set_data(self, data: list):
+        self._cancel_pending_load()
         self.listBox.delete(0, tk.END)
-        for item in data:
-            self.listBox.insert(tk.END, item)
+        # variadic insert: one Tcl call for all items
+        if data:
+            self.listBox.insert(tk.END, *data)
 
     def on_save(self):
         preset_file = filedialog.asksaveasfilename(filetypes=[("TSV files", "*.tsv"), ("CSV files", "*.csv"), ("Text files", "*.lst.txt"), ("List files", "*.list")])
@@ -1474,15 +2074,29 @@ class ListEntry(Entry):
         preset_file = filedialog.askopenfilename(filetypes=[("TSV files", "*.tsv"), ("CSV files", "*.csv"), ("Text files", "*.lst.txt"), ("List files", "*.list")])
         if not preset_file:
             return
+        self._cancel_pending_load()
         self.listBox.delete(0, tk.END)  # Clear existing items
         ext = osp.splitext(preset_file)[1].lower()
         rows = util.load_dsv(preset_file, delimiter=',' if ext == '.csv' else '\t', encoding=util.LOCALE_CODEC) if ext in ['.tsv', '.csv'] else util.load_lines(preset_file, rmlineend=True, encoding=util.LOCALE_CODEC)
         delim = ',' if ext == '.csv' else '\t'
-        for row in rows:
-            # save row as string
-            if isinstance(row, (list, tuple)):
-                row = delim.join(row)
-            self.listBox.insert(tk.END, row)
+        # save row as string
+        items = (delim.join(row) if isinstance(row, (list, tuple)) else row for row in rows)
+        self._insert_chunk(items)
+
+    def _insert_chunk(self, items, chunk_size=500):
+        """
+        - insert one chunk, then yield to the event loop so that a huge file does not freeze the ui
+        """
+        if not (chunk := list(itertools.islice(items, chunk_size))):
+            self.pendingLoad = None
+            return
+        self.listBox.insert(tk.END, *chunk)
+        self.pendingLoad = self.after_idle(self._insert_chunk, items, chunk_size)
+
+    def _cancel_pending_load(self):
+        if self.pendingLoad:
+            self.after_cancel(self.pendingLoad)
+            self.pendingLoad = None
 
     def on_add(self):
         """